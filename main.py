@@ -7,108 +7,306 @@ Screening task for GSOC application
 import argparse
 import json
 import csv
+import hashlib
+import multiprocessing
 import os
 import re
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from urllib.parse import urlparse
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
-import requests
-from bs4 import BeautifulSoup
-from dateutil import parser as date_parser
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+
+# Shared HTTP session so repeated fetches reuse pooled keep-alive connections;
+# created on first fetch so --help and cached runs never import requests
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+# Connections kept per host; batch mode raises it to its fetch concurrency
+_SESSION_POOL_MAXSIZE = 16
+
+
+def _mount_adapter(session):
+    """Mount a retrying HTTP adapter sized to _SESSION_POOL_MAXSIZE on the session"""
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=_SESSION_POOL_MAXSIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+
+def _get_session():
+    """Return the shared requests session, creating it on first use"""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from urllib3.util.request import ACCEPT_ENCODING
+            
+            session = requests.Session()
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+                # Only advertise codings urllib3 can decode (br needs brotli installed)
+                'Accept-Encoding': ACCEPT_ENCODING
+            })
+            _mount_adapter(session)
+            _SESSION = session
+    return _SESSION
+
+
+def _size_session_pool(maxsize: int):
+    """Grow the per-host connection pool so maxsize concurrent fetches never discard connections"""
+    global _SESSION_POOL_MAXSIZE
+    with _SESSION_LOCK:
+        if maxsize <= _SESSION_POOL_MAXSIZE:
+            return
+        _SESSION_POOL_MAXSIZE = maxsize
+        if _SESSION is not None:
+            _mount_adapter(_SESSION)
+
+
+# On-disk cache of ingested FOAs, keyed by URL
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'foa')
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+
+
+# Patterns are compiled once at import time and shared by every ingester
+_AGENCY_RES = [re.compile(p, re.I) for p in (
+    r'Agency:\s*([^\n]+)',
+    r'Funding Agency:\s*([^\n]+)',
+    r'Department:\s*([^\n]+)'
+)]
+
+# Each date regex matches any of its labels in a single pass over the text
+_GRANTS_GOV_DATE_RE = re.compile(
+    r'(Open Date|Post Date|Close Date|Due Date)[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    re.I
+)
+
+_NSF_DATE_RE = re.compile(
+    r'(Full Proposal Deadline|Proposal Deadline|Deadline|Due)[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    re.I
+)
+
+# Grants.gov detail tables label dates in <dt>/<th> cells; whole-word stems map them onto the regex labels
+_DATE_LABEL_SELECTOR = 'dt, th, .label'
+_GRANTS_GOV_DATE_STEMS = (
+    (re.compile(r'\bopen(?:ed|ing)?\b'), 'open date'),
+    (re.compile(r'\bpost(?:ed|ing)?\b'), 'post date'),
+    (re.compile(r'\bclos(?:e|ed|ing)\b'), 'close date'),
+    (re.compile(r'\bdue\b'), 'due date')
+)
+# Amended dates are labelled "Current ..." and supersede "Original ..." ones; unmarked labels rank between
+_DATE_LABEL_RANKS = (
+    (re.compile(r'\bcurrent\b'), 2),
+    (re.compile(r'\boriginal\b'), 0)
+)
+_DATE_VALUE_RE = re.compile(
+    r'(?<!\d)(?:\d{4}-\d{2}-\d{2}|\d{1,2}[/-]\d{1,2}[/-]\d{2,4})(?!\d)|[A-Z][a-z]{2,8}\.? \d{1,2}, \d{4}'
+)
+
+# A dollar amount, optionally prefixed by "up to" and followed by a range or unit
+_AWARD_RE = re.compile(
+    r'(?:up to )?\$[\d,]+(?:\.\d+)?(?:\s*(?:to|-)\s*\$?[\d,]+(?:\.\d+)?|\s*(?:million|M|thousand|K)\b)?',
+    re.I
+)
+
+_URL_ID_RE = re.compile(r'/(\d+)/')
+
+_ASCII_LOWER = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+# Block headings introduce the following element; inline labels introduce the rest of their block
+_SECTION_HEADING_TAGS = ['h1', 'h2', 'h3', 'h4']
+_SECTION_LABEL_TAGS = ['strong', 'b']
+_INLINE_TAGS = frozenset(['a', 'abbr', 'b', 'em', 'font', 'i', 'small', 'span', 'strong', 'sub', 'sup', 'u'])
+
+
+def _first_date_matches(pattern: re.Pattern, text: str) -> Dict[str, str]:
+    """Map each lowercased date label to the first date string following it"""
+    dates = {}
+    for match in pattern.finditer(text):
+        dates.setdefault(match.group(1).lower(), match.group(2))
+    return dates
+
+
+@lru_cache(maxsize=256)
+def _parse_date_iso(date_string: str) -> str:
+    """Parse a date string to ISO format, memoizing repeated strings"""
+    from dateutil import parser as date_parser
+    return date_parser.parse(date_string).isoformat()
+
+
+def _parse_first_date(dates: Dict[str, str], labels: Tuple[str, ...]) -> Optional[str]:
+    """Return the first parseable date, in label priority order, as ISO format"""
+    for label in labels:
+        if label in dates:
+            try:
+                return _parse_date_iso(dates[label])
+            except (ValueError, TypeError):
+                pass
+    return None
+
+
+def url_cache_key(url: str) -> str:
+    """Deterministic cache key for a FOA URL"""
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def cache_ttl_from_env() -> float:
+    """Cache lifetime in seconds from FOA_CACHE_TTL; 0 disables the cache"""
+    try:
+        return float(os.environ.get('FOA_CACHE_TTL', DEFAULT_CACHE_TTL))
+    except ValueError:
+        return DEFAULT_CACHE_TTL
+
+
+def _is_soup(tree) -> bool:
+    """Whether a parsed tree is a BeautifulSoup document rather than a selectolax one"""
+    return LexborHTMLParser is None or not isinstance(tree, LexborHTMLParser)
+
+
+def _next_element(node, tags: Optional[Tuple[str, ...]] = None):
+    """Return the next element sibling of a selectolax node, optionally limited to the given tags"""
+    node = node.next
+    while node is not None and (node.tag.startswith('-') or (tags and node.tag not in tags)):
+        node = node.next
+    return node
 
 
 class FOAIngester:
     """Ingests and processes Funding Opportunity Announcements (FOAs)"""
     
-    def __init__(self, url: str):
+    # Section keywords, tried in order
+    GRANTS_GOV_ELIGIBILITY = ('eligibility', 'eligible', 'qualification')
+    GRANTS_GOV_DESCRIPTION = ('description', 'summary', 'overview', 'purpose')
+    NSF_ELIGIBILITY = ('eligibility', 'eligible', 'who may')
+    NSF_DESCRIPTION = ('description', 'summary', 'overview', 'synopsis')
+    
+    def __init__(self, url: str, cache_dir: Optional[str] = DEFAULT_CACHE_DIR):
         self.url = url
         self.domain = urlparse(url).netloc.lower()
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl_from_env()
         self.foa_data = {}
+        self._html = None
+        self._tree = None
         
     def fetch_content(self) -> str:
         """Fetch HTML content from the URL"""
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        import requests
         try:
-            response = requests.get(self.url, headers=headers, timeout=30)
+            response = _get_session().get(self.url, timeout=30)
             response.raise_for_status()
             return response.text
         except requests.exceptions.RequestException as e:
             raise ValueError(f"Failed to fetch content from URL: {e}")
     
+    def _parse_html(self, html: str):
+        """Parse HTML once per document
+
+        Uses selectolax's C parser when installed, otherwise BeautifulSoup
+        with lxml (or html.parser if lxml is missing).
+        """
+        if self._tree is None or self._html is not html:
+            if LexborHTMLParser is not None:
+                tree = LexborHTMLParser(html)
+                # BeautifulSoup leaves script and style contents out of get_text()
+                tree.strip_tags(['script', 'style'])
+            else:
+                from bs4 import BeautifulSoup, FeatureNotFound
+                try:
+                    tree = BeautifulSoup(html, 'lxml')
+                except FeatureNotFound:
+                    tree = BeautifulSoup(html, 'html.parser')
+            self._tree = tree
+            self._html = html
+            # Drop text memoized from a previously parsed document
+            self.__dict__.pop('full_text', None)
+            self.__dict__.pop('full_text_lower', None)
+        return self._tree
+    
+    @cached_property
+    def full_text(self) -> str:
+        """Text content of the parsed document"""
+        if self._tree is None:
+            return ''
+        if _is_soup(self._tree):
+            return self._tree.get_text()
+        return self._tree.root.text() if self._tree.root is not None else ''
+    
+    @cached_property
+    def full_text_lower(self) -> str:
+        """Case-folded text content of the parsed document, offset-aligned with full_text"""
+        lowered = self.full_text.casefold()
+        if len(lowered) != len(self.full_text):
+            # Case folding expanded some characters; lower ASCII only so offsets line up
+            lowered = self.full_text.translate(_ASCII_LOWER)
+        return lowered
+    
+    def _extract_title(self, tree) -> str:
+        """Extract the page title from the first <h1>, falling back to <title>"""
+        if _is_soup(tree):
+            title_elem = tree.find('h1') or tree.find('title')
+            return title_elem.get_text(strip=True) if title_elem else 'N/A'
+        title_elem = tree.css_first('h1') or tree.css_first('title')
+        return title_elem.text(strip=True) if title_elem else 'N/A'
+    
     def extract_grants_gov(self, html: str) -> Dict:
         """Extract FOA data from Grants.gov format"""
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = self._parse_html(html)
         data = {}
         
         # Extract title
-        title_elem = soup.find('h1') or soup.find('title')
-        data['title'] = title_elem.get_text(strip=True) if title_elem else 'N/A'
+        data['title'] = self._extract_title(tree)
+        
+        full_text = self.full_text
         
         # Extract agency
-        full_text = soup.get_text()
-        agency_patterns = [
-            r'Agency:\s*([^\n]+)',
-            r'Funding Agency:\s*([^\n]+)',
-            r'Department:\s*([^\n]+)'
-        ]
         agency = 'N/A'
-        for pattern in agency_patterns:
-            match = re.search(pattern, full_text, re.I)
+        for pattern in _AGENCY_RES:
+            match = pattern.search(full_text)
             if match:
                 agency = match.group(1).strip()
                 break
         
-        # Extract dates
-        open_date = None
-        close_date = None
-        date_text = soup.get_text()
-        
-        # Look for common date patterns
-        date_patterns = [
-            r'Open Date[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'Post Date[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'Close Date[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'Due Date[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, date_text, re.I)
-            if match:
-                try:
-                    parsed_date = date_parser.parse(match.group(1))
-                    if 'open' in pattern.lower() or 'post' in pattern.lower():
-                        if open_date is None:
-                            open_date = parsed_date.isoformat()
-                    elif 'close' in pattern.lower() or 'due' in pattern.lower():
-                        if close_date is None:
-                            close_date = parsed_date.isoformat()
-                except (ValueError, TypeError):
-                    pass
+        # Extract dates, letting labelled cells override the scan of the whole text per label
+        dates = _first_date_matches(_GRANTS_GOV_DATE_RE, full_text)
+        dates.update(self._extract_dom_dates(tree))
+        open_date = _parse_first_date(dates, ('open date', 'post date'))
+        close_date = _parse_first_date(dates, ('close date', 'due date'))
         
         # Extract eligibility text
-        eligibility_keywords = ['eligibility', 'eligible', 'qualification']
-        eligibility_text = self._extract_section(soup, eligibility_keywords)
+        eligibility_text = self._extract_section(tree, self.GRANTS_GOV_ELIGIBILITY)
         
         # Extract program description
-        desc_keywords = ['description', 'summary', 'overview', 'purpose']
-        program_description = self._extract_section(soup, desc_keywords)
+        program_description = self._extract_section(tree, self.GRANTS_GOV_DESCRIPTION)
         
         # Extract award range
-        full_text = soup.get_text()
-        award_patterns = [
-            r'\$[\d,]+(?:\.\d+)?\s*(?:to|-)?\s*\$?[\d,]+(?:\.\d+)?',
-            r'up to \$[\d,]+(?:\.\d+)?',
-            r'\$[\d,]+(?:\.\d+)?\s*(?:million|M|thousand|K)'
-        ]
-        award_range = None
-        for pattern in award_patterns:
-            match = re.search(pattern, full_text, re.I)
-            if match:
-                award_range = match.group(0)
-                break
+        match = _AWARD_RE.search(full_text)
+        award_range = match.group(0) if match else None
         
         # Generate FOA ID
         foa_id = self._generate_foa_id(data.get('title', ''), self.url)
@@ -127,57 +325,31 @@ class FOAIngester:
     
     def extract_nsf(self, html: str) -> Dict:
         """Extract FOA data from NSF format"""
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = self._parse_html(html)
         data = {}
         
         # Extract title
-        title_elem = soup.find('h1') or soup.find('title')
-        data['title'] = title_elem.get_text(strip=True) if title_elem else 'N/A'
+        data['title'] = self._extract_title(tree)
+        
+        full_text = self.full_text
         
         # NSF is always the agency
         agency = 'National Science Foundation (NSF)'
         
         # Extract dates
         open_date = None
-        close_date = None
-        date_text = soup.get_text()
-        
-        date_patterns = [
-            r'Full Proposal Deadline[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'Proposal Deadline[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'Deadline[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-            r'Due[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, date_text, re.I)
-            if match:
-                try:
-                    parsed_date = date_parser.parse(match.group(1))
-                    if close_date is None:
-                        close_date = parsed_date.isoformat()
-                except (ValueError, TypeError):
-                    pass
+        dates = _first_date_matches(_NSF_DATE_RE, full_text)
+        close_date = _parse_first_date(dates, ('full proposal deadline', 'proposal deadline', 'deadline', 'due'))
         
         # Extract eligibility
-        eligibility_text = self._extract_section(soup, ['eligibility', 'eligible', 'who may'])
+        eligibility_text = self._extract_section(tree, self.NSF_ELIGIBILITY)
         
         # Extract program description
-        program_description = self._extract_section(soup, ['description', 'summary', 'overview', 'synopsis'])
+        program_description = self._extract_section(tree, self.NSF_DESCRIPTION)
         
         # Extract award range
-        full_text = soup.get_text()
-        award_patterns = [
-            r'\$[\d,]+(?:\.\d+)?\s*(?:to|-)?\s*\$?[\d,]+(?:\.\d+)?',
-            r'up to \$[\d,]+(?:\.\d+)?',
-            r'\$[\d,]+(?:\.\d+)?\s*(?:million|M|thousand|K)'
-        ]
-        award_range = None
-        for pattern in award_patterns:
-            match = re.search(pattern, full_text, re.I)
-            if match:
-                award_range = match.group(0)
-                break
+        match = _AWARD_RE.search(full_text)
+        award_range = match.group(0) if match else None
         
         foa_id = self._generate_foa_id(data.get('title', ''), self.url)
         
@@ -193,31 +365,112 @@ class FOAIngester:
             'source_url': self.url
         }
     
-    def _extract_section(self, soup: BeautifulSoup, keywords: List[str]) -> Optional[str]:
+    def _extract_section(self, tree, keywords: Tuple[str, ...]) -> Optional[str]:
         """Extract text from a section containing keywords"""
-        text = soup.get_text()
+        # Prefer the block that follows a matching heading, then fall back to the text
+        section = self._extract_dom_section(tree, keywords)
+        if section is None:
+            section = self._extract_text_section(keywords)
+        
+        if section is None:
+            return None
+        # Limit to reasonable length
+        if len(section) > 500:
+            section = section[:500] + '...'
+        return section
+    
+    def _extract_text_section(self, keywords: Tuple[str, ...]) -> Optional[str]:
+        """Extract the paragraph following the first keyword found in the document text"""
+        text = self.full_text
+        lowered = self.full_text_lower
+        
         for keyword in keywords:
-            # Escape special regex characters in keyword
-            escaped_keyword = re.escape(keyword)
-            pattern = re.compile(rf'{escaped_keyword}[:\s]*([^\n]+(?:\n[^\n]+)*)', re.I)
-            match = re.search(pattern, text)
+            index = lowered.find(keyword.casefold())
+            if index < 0:
+                continue
+            
+            # Skip the separator after the keyword, then take lines up to the next blank line
+            start = index + len(keyword)
+            while start < len(text) and (text[start] == ':' or text[start].isspace()):
+                start += 1
+            end = text.find('\n\n', start)
+            section = text[start:end if end >= 0 else len(text)].strip()
+            if section:
+                return section
+        return None
+    
+    def _extract_dom_dates(self, tree) -> Dict[str, str]:
+        """Map Grants.gov date labels to the date in their <dd>/<td> value cell
+        
+        When a label occurs more than once, a later cell replaces an earlier
+        one only if it ranks higher (e.g. "Current" over "Original").
+        """
+        dates = {}
+        ranks = {}
+        is_soup = _is_soup(tree)
+        for label_elem in (tree.select(_DATE_LABEL_SELECTOR) if is_soup else tree.css(_DATE_LABEL_SELECTOR)):
+            key = (label_elem.get_text(' ', strip=True) if is_soup else label_elem.text(separator=' ', strip=True)).lower()
+            label = next((label for stem, label in _GRANTS_GOV_DATE_STEMS if stem.search(key)), None)
+            if label is None:
+                continue
+            rank = next((rank for pattern, rank in _DATE_LABEL_RANKS if pattern.search(key)), 1)
+            if rank <= ranks.get(label, -1):
+                continue
+            
+            value_elem = label_elem.find_next_sibling(['dd', 'td']) if is_soup else _next_element(label_elem, ('dd', 'td'))
+            if value_elem is None:
+                continue
+            value = value_elem.get_text(' ', strip=True) if is_soup else value_elem.text(separator=' ', strip=True)
+            match = _DATE_VALUE_RE.search(value)
             if match:
-                section = match.group(1).strip()
-                # Limit to reasonable length
-                if len(section) > 500:
-                    section = section[:500] + '...'
+                dates[label] = match.group(0)
+                ranks[label] = rank
+        return dates
+    
+    def _extract_dom_section(self, tree, keywords: Tuple[str, ...]) -> Optional[str]:
+        """Extract the section introduced by the first heading or inline label that mentions a keyword"""
+        is_soup = _is_soup(tree)
+        tags = _SECTION_HEADING_TAGS + _SECTION_LABEL_TAGS
+        for heading in (tree.find_all(tags) if is_soup else tree.css(', '.join(tags))):
+            heading_text = heading.get_text() if is_soup else heading.text()
+            if not any(keyword in heading_text.lower() for keyword in keywords):
+                continue
+            
+            if (heading.name if is_soup else heading.tag) in _SECTION_LABEL_TAGS:
+                section = self._label_section(heading, heading_text, is_soup)
+            else:
+                sibling = heading.find_next_sibling() if is_soup else _next_element(heading)
+                if sibling is None:
+                    continue
+                section = sibling.get_text(' ', strip=True) if is_soup else sibling.text(separator=' ', strip=True)
+            if section:
                 return section
         return None
     
+    def _label_section(self, label, label_text: str, is_soup: bool) -> str:
+        """Return the text of an inline label's enclosing block that follows the label"""
+        block = label.parent
+        while block is not None and (block.name if is_soup else block.tag) in _INLINE_TAGS:
+            block = block.parent
+        if block is None:
+            return ''
+        
+        block_text = block.get_text() if is_soup else block.text()
+        index = block_text.find(label_text)
+        if index < 0:
+            return ''
+        return block_text[index + len(label_text):].strip(': \t\r\n')
+    
     def _generate_foa_id(self, title: str, url: str) -> str:
         """Generate a unique FOA ID"""
         # Try to extract ID from URL first
-        url_id_match = re.search(r'/(\d+)/', url)
+        url_id_match = _URL_ID_RE.search(url)
         if url_id_match:
             return f"FOA-{url_id_match.group(1)}"
         
-        # Generate from title hash
-        title_hash = abs(hash(title)) % 100000
+        # Generate from a stable title digest so IDs match across runs; SHA-256 goes
+        # through OpenSSL, which uses the CPU's SHA extensions where available
+        title_hash = hashlib.sha256(title.encode('utf-8')).digest()[:5].hex()
         return f"FOA-{title_hash}"
     
     def _infer_agency_from_url(self) -> str:
@@ -231,16 +484,94 @@ class FOAIngester:
         else:
             return 'Unknown Agency'
     
-    def ingest(self) -> Dict:
-        """Main ingestion method"""
-        html = self.fetch_content()
-        
+    def parse(self, html: str) -> Dict:
+        """Extract FOA data from already fetched HTML, without any network access"""
         if 'nsf.gov' in self.domain:
             self.foa_data = self.extract_nsf(html)
         else:
             self.foa_data = self.extract_grants_gov(html)
         
         return self.foa_data
+    
+    def _cache_path(self) -> Optional[str]:
+        """Path of this URL's cache entry, or None when caching is disabled"""
+        if not self.cache_dir or self.cache_ttl <= 0:
+            return None
+        return os.path.join(self.cache_dir, f"{url_cache_key(self.url)}.json")
+    
+    def load_cached(self) -> Optional[Dict]:
+        """Return the cached FOA data for this URL if it is younger than the TTL"""
+        cache_path = self._cache_path()
+        if cache_path is None:
+            return None
+        try:
+            if time.time() - os.path.getmtime(cache_path) > self.cache_ttl:
+                return None
+            with open(cache_path, 'rb') as f:
+                content = f.read()
+            return orjson.loads(content) if orjson is not None else json.loads(content)
+        except (OSError, ValueError):
+            # Missing or unreadable entries are treated as a cache miss
+            return None
+    
+    def store_cached(self, foa_data: Dict):
+        """Write FOA data to this URL's cache entry; failures only mean the entry is not cached"""
+        cache_path = self._cache_path()
+        if cache_path is None:
+            return
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            os.close(fd)
+            save_json(foa_data, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+    
+    def ingest(self, parse_pool: Optional[Executor] = None) -> Dict:
+        """Main ingestion method, served from the disk cache while its entry is fresh
+        
+        When parse_pool is given, HTML parsing and semantic tagging run on it
+        instead of the calling thread, and the returned record carries its
+        tags. The cache entry is stored without them either way.
+        """
+        cached = self.load_cached()
+        if cached is not None:
+            self.foa_data = cached
+            return self.foa_data
+        
+        html = self.fetch_content()
+        if parse_pool is None:
+            self.parse(html)
+        else:
+            self.foa_data = parse_pool.submit(parse_foa, html, self.url).result()
+        self.store_cached({key: value for key, value in self.foa_data.items() if key != 'semantic_tags'})
+        return self.foa_data
+
+
+def _build_keyword_index(ontologies: Tuple[Tuple[str, Dict[str, List[str]]], ...]) -> Dict[str, Tuple[Tuple[str, str], ...]]:
+    """Flatten category ontologies into a case-folded keyword -> (category, label) pairs index"""
+    index = {}
+    for category, ontology in ontologies:
+        for label, keywords in ontology.items():
+            for keyword in keywords:
+                index.setdefault(keyword.casefold(), []).append((category, label))
+    return {keyword: tuple(pairs) for keyword, pairs in index.items()}
+
+
+def _build_automaton(keyword_index: Dict[str, Tuple[Tuple[str, str], ...]]):
+    """Build an Aho-Corasick automaton whose values are each keyword's (category, label) pairs"""
+    automaton = ahocorasick.Automaton()
+    for keyword, pairs in keyword_index.items():
+        automaton.add_word(keyword, pairs)
+    automaton.make_automaton()
+    return automaton
 
 
 class SemanticTagger:
@@ -270,9 +601,37 @@ class SemanticTagger:
         'communities': ['community', 'public', 'population', 'society']
     }
     
+    ONTOLOGIES = (
+        ('research_domains', RESEARCH_DOMAINS),
+        ('methods', METHODS),
+        ('populations', POPULATIONS)
+    )
+    
+    # Reverse index keyword -> ((category, label), ...) and its automaton, built at class definition
+    KEYWORD_INDEX = _build_keyword_index(ONTOLOGIES)
+    _AUTOMATON = _build_automaton(KEYWORD_INDEX) if ahocorasick is not None else None
+    
+    def _match_labels(self, text: str) -> Dict[str, set]:
+        """Return the set of matched ontology labels for each category in case-folded text"""
+        hits = {category: set() for category, _ in self.ONTOLOGIES}
+        
+        if self._AUTOMATON is not None:
+            # Single linear scan reports every keyword occurrence, overlaps included
+            for _, pairs in self._AUTOMATON.iter(text):
+                for category, label in pairs:
+                    hits[category].add(label)
+        else:
+            for keyword, pairs in self.KEYWORD_INDEX.items():
+                if keyword in text:
+                    for category, label in pairs:
+                        hits[category].add(label)
+        
+        return hits
+    
     def tag(self, foa_data: Dict) -> Dict:
         """Apply semantic tags to FOA data"""
-        text = f"{foa_data.get('title', '')} {foa_data.get('program_description', '')} {foa_data.get('eligibility_text', '')}".lower()
+        # A single case-folded copy is the only preprocessing pass before the keyword scan
+        text = f"{foa_data.get('title', '')} {foa_data.get('program_description', '')} {foa_data.get('eligibility_text', '')}".casefold()
         
         tags = {
             'research_domains': [],
@@ -281,20 +640,10 @@ class SemanticTagger:
             'sponsor_themes': []
         }
         
-        # Tag research domains
-        for domain, keywords in self.RESEARCH_DOMAINS.items():
-            if any(keyword in text for keyword in keywords):
-                tags['research_domains'].append(domain)
-        
-        # Tag methods
-        for method, keywords in self.METHODS.items():
-            if any(keyword in text for keyword in keywords):
-                tags['methods'].append(method)
-        
-        # Tag populations
-        for population, keywords in self.POPULATIONS.items():
-            if any(keyword in text for keyword in keywords):
-                tags['populations'].append(population)
+        # Tag research domains, methods and populations, keeping ontology order
+        hits = self._match_labels(text)
+        for category, ontology in self.ONTOLOGIES:
+            tags[category] = [label for label in ontology if label in hits[category]]
         
         # Sponsor themes (infer from agency)
         agency = foa_data.get('agency', '').lower()
@@ -309,16 +658,96 @@ class SemanticTagger:
         return foa_data
 
 
+def parse_foa(html: str, url: str) -> Dict:
+    """Parse and tag one fetched FOA page; a module-level function so worker processes can run it"""
+    return SemanticTagger().tag(FOAIngester(url, cache_dir=None).parse(html))
+
+
+def process_url(url: str, cache_dir: Optional[str] = DEFAULT_CACHE_DIR, parse_pool: Optional[Executor] = None) -> Dict:
+    """Ingest and tag a single FOA; the ingester's cache holds untagged records"""
+    foa_data = FOAIngester(url, cache_dir).ingest(parse_pool)
+    if 'semantic_tags' not in foa_data:
+        # Cache hits and in-thread parses come back untagged; pool workers tag their own
+        foa_data = SemanticTagger().tag(foa_data)
+    return foa_data
+
+
+class _LazyProcessPool(Executor):
+    """Process pool that starts its workers only when the first job is submitted
+    
+    Workers are started with forkserver (or spawn) rather than fork, because
+    jobs are submitted from fetch threads and forking a multithreaded
+    process can deadlock.
+    """
+    
+    def __init__(self):
+        self._pool = None
+        self._lock = threading.Lock()
+    
+    def submit(self, fn, /, *args, **kwargs):
+        with self._lock:
+            if self._pool is None:
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+                self._pool = ProcessPoolExecutor(mp_context=context)
+        return self._pool.submit(fn, *args, **kwargs)
+    
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+def process_batch(urls: List[str], cache_dir: Optional[str] = DEFAULT_CACHE_DIR, concurrency: int = 8) -> Iterator[Tuple[str, Optional[Dict], Optional[Exception]]]:
+    """Process many FOAs concurrently, yielding (url, foa_data, error) in input order
+    
+    Fetching runs on a thread pool of the given concurrency; HTML parsing
+    is GIL-bound, so it runs on a process pool with one worker per core.
+    """
+    _size_session_pool(concurrency)
+    with _LazyProcessPool() as parse_pool, ThreadPoolExecutor(max_workers=concurrency) as fetch_pool:
+        futures = [(url, fetch_pool.submit(process_url, url, cache_dir, parse_pool)) for url in urls]
+        for url, future in futures:
+            try:
+                yield url, future.result(), None
+            except Exception as e:
+                yield url, None, e
+
+
+def load_urls(path: str) -> List[str]:
+    """Read FOA URLs from a file, one per line, skipping blanks and # comments"""
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+
+
 def save_json(data: Dict, output_path: str):
     """Save FOA data as JSON"""
+    if orjson is not None:
+        # orjson always emits UTF-8, matching ensure_ascii=False
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    
     with open(output_path, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
 
 
-def save_csv(data: Dict, output_path: str):
-    """Save FOA data as CSV"""
-    # Flatten semantic tags for CSV
-    csv_row = {
+def _json_line(data: Dict) -> bytes:
+    """Serialize FOA data as a single UTF-8 JSON Lines record"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+CSV_FIELDS = [
+    'foa_id', 'title', 'agency', 'open_date', 'close_date', 'eligibility_text',
+    'program_description', 'award_range', 'source_url',
+    'research_domains', 'methods', 'populations', 'sponsor_themes'
+]
+
+
+def _csv_row(data: Dict) -> Dict:
+    """Flatten FOA data, including semantic tags, into a CSV row"""
+    return {
         'foa_id': data.get('foa_id', ''),
         'title': data.get('title', ''),
         'agency': data.get('agency', ''),
@@ -333,13 +762,82 @@ def save_csv(data: Dict, output_path: str):
         'populations': '; '.join(data.get('semantic_tags', {}).get('populations', [])),
         'sponsor_themes': '; '.join(data.get('semantic_tags', {}).get('sponsor_themes', []))
     }
+
+
+def save_csv(data: Dict, output_path: str):
+    """Save FOA data as CSV"""
+    # Flatten semantic tags for CSV
+    csv_row = _csv_row(data)
     
     with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=csv_row.keys())
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
         writer.writeheader()
         writer.writerow(csv_row)
 
 
+class BatchWriter:
+    """Streams FOA records to JSON Lines and CSV files opened once per batch
+    
+    Both files are opened in append mode; the CSV header is only written
+    when the CSV file is new or empty.
+    """
+    
+    def __init__(self, json_path: str, csv_path: str):
+        self.json_path = json_path
+        self.csv_path = csv_path
+        self._json_file = None
+        self._csv_file = None
+        self._csv_writer = None
+    
+    def __enter__(self) -> 'BatchWriter':
+        self._json_file = open(self.json_path, 'ab', buffering=1 << 20)
+        self._csv_file = open(self.csv_path, 'a', newline='', encoding='utf-8', buffering=1 << 20)
+        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=CSV_FIELDS)
+        if self._csv_file.tell() == 0:
+            self._csv_writer.writeheader()
+        return self
+    
+    def write(self, data: Dict):
+        """Append one FOA record to both outputs"""
+        self._json_file.write(_json_line(data))
+        self._csv_writer.writerow(_csv_row(data))
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._json_file.close()
+        self._csv_file.close()
+
+
+def run_batch(urls: List[str], args: argparse.Namespace):
+    """Process several FOAs and append them to foa.jsonl and foa.csv"""
+    try:
+        os.makedirs(args.out_dir, exist_ok=True)
+        json_path = os.path.join(args.out_dir, 'foa.jsonl')
+        csv_path = os.path.join(args.out_dir, 'foa.csv')
+        
+        processed = 0
+        failures = 0
+        with BatchWriter(json_path, csv_path) as writer:
+            for url, foa_data, error in process_batch(urls, args.cache_dir, args.concurrency):
+                if error is not None:
+                    failures += 1
+                    print(f"Error processing FOA {url}: {error}", file=sys.stderr)
+                    continue
+                writer.write(foa_data)
+                processed += 1
+                print(f"Successfully processed FOA: {foa_data.get('foa_id')}")
+        
+        print(f"Processed {processed} of {len(urls)} FOAs")
+        print(f"JSON Lines saved to: {json_path}")
+        print(f"CSV saved to: {csv_path}")
+        
+    except Exception as e:
+        print(f"Error processing FOAs: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    if failures:
+        sys.exit(1)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='FOA Ingestion and Semantic Tagging Pipeline',
@@ -348,8 +846,14 @@ def main():
     parser.add_argument(
         '--url',
         type=str,
-        required=True,
-        help='URL of the FOA to ingest (Grants.gov or NSF)'
+        action='append',
+        help='URL of the FOA to ingest (Grants.gov or NSF); repeat for batch mode'
+    )
+    parser.add_argument(
+        '--urls_file',
+        type=str,
+        default=None,
+        help='File with one FOA URL per line, processed in batch mode'
     )
     parser.add_argument(
         '--out_dir',
@@ -357,20 +861,42 @@ def main():
         default='./out',
         help='Output directory for JSON and CSV files (default: ./out)'
     )
+    parser.add_argument(
+        '--cache_dir',
+        type=str,
+        default=DEFAULT_CACHE_DIR,
+        help='Directory for cached FOA results; repeat URLs skip fetching until FOA_CACHE_TTL '
+             'seconds have passed (default: ~/.cache/foa, TTL one day, FOA_CACHE_TTL=0 disables)'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=8,
+        help='Number of FOAs fetched in parallel in batch mode (default: 8)'
+    )
     
     args = parser.parse_args()
     
+    urls = list(args.url or [])
+    if args.urls_file:
+        try:
+            urls.extend(load_urls(args.urls_file))
+        except OSError as e:
+            parser.error(f"cannot read --urls_file: {e}")
+    if not urls:
+        parser.error('one of --url or --urls_file is required')
+    if args.concurrency < 1:
+        parser.error('--concurrency must be at least 1')
+    
+    if len(urls) > 1:
+        run_batch(urls, args)
+        return
+    
     try:
         # Create output directory if it doesn't exist
         os.makedirs(args.out_dir, exist_ok=True)
         
-        # Ingest FOA
-        ingester = FOAIngester(args.url)
-        foa_data = ingester.ingest()
-        
-        # Apply semantic tags
-        tagger = SemanticTagger()
-        foa_data = tagger.tag(foa_data)
+        foa_data = process_url(urls[0], args.cache_dir)
         
         # Save outputs
         json_path = os.path.join(args.out_dir, 'foa.json')